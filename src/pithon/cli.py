@@ -1,7 +1,8 @@
 from pathlib import Path
 import sys
 import os
-from pithon.evaluator.evaluator import initial_env, evaluate
+from pithon.evaluator import jit
+from pithon.evaluator.evaluator import initial_env, run
 from pithon.parser.simpleparser import SimpleParser
 from pithon.syntax import PiAssignment
 
@@ -24,7 +25,7 @@ def run_cli(ast_only=False):
             if ast_only:
                 print(tree)
                 continue
-            result = evaluate(tree, env)
+            result = run(tree, env)
             if not isinstance(tree, PiAssignment):
                 print(result)
         except Exception as e:
@@ -39,7 +40,7 @@ def run_file(filename, ast_only=False):
     if ast_only:
         print(tree)
         return
-    evaluate(tree, env)
+    run(tree, env)
 
 def run_tests():
     test_dir = Path("tests/fixtures/programs")
@@ -56,6 +57,10 @@ def run_tests():
             print(f"Erreur dans {fname}: {e}")
 
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "--jit":
+        # Compile les fonctions purement numériques avec Numba
+        jit.enabled = True
+        del sys.argv[1]
     if len(sys.argv) > 1:
         if sys.argv[1] == "--test":
             run_tests()
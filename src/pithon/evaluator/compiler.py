@@ -0,0 +1,268 @@
+"""
+Passe de compilation des programmes Pithon.
+Parcourt l'arbre une seule fois avant l'évaluation pour résoudre ce qui peut
+l'être statiquement et mettre en cache le corps des fonctions.
+"""
+
+from dataclasses import fields
+from pithon.evaluator.envvalue import (
+    EnvValue, VBool, VList, VNumber, VString, VTuple, VNONE, box_bool, box_number
+)
+from pithon.evaluator.primitive import get_number_operation_dict, get_primitive_dict
+from pithon.syntax import (
+    PiNode, PiAssignment, PiBinaryOperation, PiProgram, PiVariable,
+    PiFunctionCall, PiFunctionDef, PiFor, PiClassDef, PiConst, PiNumber,
+    PiBool, PiString, PiNone, PiList, PiTuple, PiNot, PiIfThenElse, PiIn
+)
+
+_OPERATORS = get_primitive_dict()
+_NUMBER_OPERATIONS = get_number_operation_dict()
+
+# Champs contenant une suite d'instructions, dans laquelle un if à condition
+# constante peut être remplacé par la branche retenue.
+_BODY_FIELDS = frozenset(('body', 'then_branch', 'else_branch'))
+
+# Taille maximale d'une chaîne, liste ou tuple calculé à la compilation : au
+# delà, le résultat est laissé à l'exécution pour ne pas grossir le programme.
+_MAX_FOLDED_LENGTH = 4096
+
+# Types des éléments qu'un test 'in' peut chercher dans un ensemble précalculé
+MEMBERSHIP_TYPES = frozenset((VNumber, VString, VBool))
+
+# Taille minimale d'un conteneur littéral pour précalculer cet ensemble ; en
+# dessous, le parcours linéaire est aussi rapide.
+_MIN_SET_LENGTH = 4
+
+
+def compile_program(program: PiProgram) -> PiProgram:
+    """Compile un programme (ou une instruction seule) et le retourne."""
+    if isinstance(program, list):
+        _fold_body(program)
+        for stmt in program:
+            compile_node(stmt)
+    else:
+        program = constant_fold(program)
+        compile_node(program)
+    return program
+
+
+def constant_fold(node: PiNode) -> PiNode:
+    """
+    Remplace les sous-arbres constants par des nœuds PiConst portant leur
+    valeur précalculée, et retourne le nœud à utiliser à la place de `node`.
+    Une opération qui échoue (division par zéro...) n'est pas précalculée :
+    l'erreur se produira à l'exécution, comme sans cette passe.
+    """
+    for f in fields(node):
+        if not f.init:
+            continue
+        value = getattr(node, f.name)
+        if isinstance(value, PiNode):
+            setattr(node, f.name, constant_fold(value))
+        elif isinstance(value, list):
+            if f.name in _BODY_FIELDS:
+                _fold_body(value)
+            else:
+                value[:] = [constant_fold(item) if isinstance(item, PiNode) else item
+                            for item in value]
+        elif isinstance(value, tuple):
+            setattr(node, f.name, tuple(constant_fold(item) if isinstance(item, PiNode) else item
+                                        for item in value))
+
+    if isinstance(node, PiBinaryOperation):
+        left = _constant_value(node.left)
+        right = _constant_value(node.right)
+        operation = _OPERATORS.get(node.operator)
+        if left is None or right is None or operation is None:
+            return node
+        try:
+            result = operation([left, right])
+        except Exception:
+            return node
+        if type(result) is VList:
+            size = len(result)
+        elif isinstance(result, (VString, VTuple)):
+            size = len(result.value)
+        else:
+            size = 0
+        if size > _MAX_FOLDED_LENGTH:
+            return node
+        return PiConst(result)
+    if isinstance(node, PiNot):
+        operand = _constant_value(node.operand)
+        if type(operand) is VBool:
+            return PiConst(box_bool(not operand.value))
+        return node
+    if isinstance(node, (PiList, PiTuple)):
+        elements = [_constant_value(e) for e in node.elements]
+        if any(e is None for e in elements):
+            return node
+        if isinstance(node, PiList):
+            return PiConst(VList.specialized(elements))
+        return PiConst(VTuple(tuple(elements)))
+    return node
+
+
+def _fold_body(body: list) -> None:
+    """
+    Précalcule les constantes d'une suite d'instructions, sur place. Un if
+    dont la condition est un booléen constant est remplacé par les
+    instructions de la branche retenue, ou par None si elle est vide.
+    """
+    folded = []
+    for stmt in body:
+        stmt = constant_fold(stmt)
+        if isinstance(stmt, PiIfThenElse):
+            condition = _constant_value(stmt.condition)
+            if type(condition) is VBool:
+                branch = stmt.then_branch if condition.value else stmt.else_branch
+                if branch:
+                    folded.extend(branch)
+                else:
+                    folded.append(PiConst(VNONE))
+                continue
+        folded.append(stmt)
+    body[:] = folded
+
+
+def _constant_value(node: PiNode) -> EnvValue | None:
+    """Retourne la valeur d'un nœud constant, ou None s'il ne l'est pas."""
+    if isinstance(node, PiConst):
+        return node.value
+    if isinstance(node, PiNumber):
+        return box_number(node.value)
+    if isinstance(node, PiBool):
+        return box_bool(node.value)
+    if isinstance(node, PiString):
+        return VString(node.value)
+    if isinstance(node, PiNone):
+        return VNONE
+    return None
+
+
+def compile_node(node: PiNode, scope: dict[str, int] | None = None) -> None:
+    """
+    Compile un nœud puis ses sous-nœuds.
+    `scope` associe aux variables locales de la fonction englobante leur
+    emplacement ; il vaut None au niveau du module.
+    """
+    if not isinstance(node, PiNode):
+        raise TypeError(f"Type de nœud non supporté : {type(node)}")
+
+    if isinstance(node, (PiVariable, PiAssignment, PiFunctionDef, PiClassDef)):
+        node._slot = _resolve_slot(node.name, scope)
+    elif isinstance(node, PiFor):
+        node._slot = _resolve_slot(node.var, scope)
+        # Seule la forme est vérifiée ici : range peut être redéfini, ce que
+        # l'évaluateur contrôle à chaque exécution de la boucle.
+        iterable = node.iterable
+        node._range_call = (isinstance(iterable, PiFunctionCall)
+                            and isinstance(iterable.function, PiVariable)
+                            and iterable.function.name == 'range')
+    elif isinstance(node, PiBinaryOperation):
+        # Les opérateurs ne sont pas des noms : ils ne peuvent pas être redéfinis
+        node._op_fn = _OPERATORS.get(node.operator)
+        node._num_fn = _NUMBER_OPERATIONS.get(node.operator)
+    elif isinstance(node, PiFunctionCall):
+        node._args_tuple = tuple(node.args)
+    elif isinstance(node, PiIn) and isinstance(node.container, PiConst):
+        node._prebuilt_set = _membership_set(node.container.value)
+
+    if isinstance(node, PiFunctionDef):
+        # Le corps d'une fonction n'est compilé qu'une seule fois.
+        if node._compiled:
+            return
+        node._arg_names = tuple(node.arg_names)
+        node._non_self_arg_names = node._arg_names[1:]
+        node._slot_names = _collect_locals(node)
+        node._poolable = not any(_defines_scope(stmt) for stmt in node.body)
+        node._compiled = True
+        for stmt in node.body:
+            compile_node(stmt, node._slot_names)
+        return
+
+    if isinstance(node, PiClassDef):
+        # Les méthodes ne sont pas liées dans la portée englobante.
+        for method in node.methods:
+            compile_node(method)
+        return
+
+    for child in _children(node):
+        compile_node(child, scope)
+
+
+def _membership_set(container: EnvValue) -> frozenset | None:
+    """
+    Retourne l'ensemble des couples (type, valeur) des éléments d'une liste ou
+    d'un tuple constant, ou None si elle est trop courte ou contient d'autres
+    types. Le type fait partie de la clé : True n'est pas égal à 1 en Pithon.
+    """
+    if type(container) is VList:
+        if len(container) < _MIN_SET_LENGTH:
+            return None
+        if container._prim is not None:
+            return frozenset((VNumber, v) for v in container._prim)
+        elements = container.value
+    elif type(container) is VTuple:
+        elements = container.value
+    else:
+        return None
+    if len(elements) < _MIN_SET_LENGTH or any(type(e) not in MEMBERSHIP_TYPES for e in elements):
+        return None
+    return frozenset((type(e), e.value) for e in elements)
+
+
+def _resolve_slot(name: str, scope: dict[str, int] | None) -> int:
+    """Retourne l'emplacement d'une variable locale, ou -1 pour une recherche par nom."""
+    if scope is None:
+        return -1
+    return scope.get(name, -1)
+
+
+def _collect_locals(funcdef: PiFunctionDef) -> dict[str, int]:
+    """
+    Attribue un emplacement à chaque variable locale d'une fonction : d'abord
+    les paramètres (dans l'ordre), puis le paramètre variadique, puis tous
+    les noms liés dans le corps (affectations, boucles for, définitions).
+    """
+    slot_names: dict[str, int] = {}
+    for name in funcdef.arg_names:
+        slot_names.setdefault(name, len(slot_names))
+    if funcdef.vararg:
+        slot_names.setdefault(funcdef.vararg, len(slot_names))
+
+    def visit(node: PiNode) -> None:
+        if isinstance(node, (PiAssignment, PiFunctionDef, PiClassDef)):
+            slot_names.setdefault(node.name, len(slot_names))
+        elif isinstance(node, PiFor):
+            slot_names.setdefault(node.var, len(slot_names))
+        # Les fonctions et classes imbriquées ont leur propre portée.
+        if isinstance(node, (PiFunctionDef, PiClassDef)):
+            return
+        for child in _children(node):
+            visit(child)
+
+    for stmt in funcdef.body:
+        visit(stmt)
+    return slot_names
+
+
+def _defines_scope(node: PiNode) -> bool:
+    """Indique si un nœud contient une définition de fonction ou de classe."""
+    if isinstance(node, (PiFunctionDef, PiClassDef)):
+        return True
+    return any(_defines_scope(child) for child in _children(node))
+
+
+def _children(node: PiNode):
+    """Itère sur les sous-nœuds directs d'un nœud."""
+    for f in fields(node):
+        if not f.init:
+            continue
+        value = getattr(node, f.name)
+        if isinstance(value, PiNode):
+            yield value
+        elif isinstance(value, (list, tuple)):
+            for item in value:
+                if isinstance(item, PiNode):
+                    yield item
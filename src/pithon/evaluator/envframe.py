@@ -1,13 +1,63 @@
+_NO_SLOTS: dict[str, int] = {}
+
+# Nombre maximal de cadres conservés dans la réserve de EnvFrame
+POOL_SIZE = 256
+
+
 class EnvFrame:
     """
     Représente un cadre d'environnement pour stocker des variables avec un lien vers un parent.
+    Les cadres d'appel de fonction rangent en plus leurs variables locales dans
+    une liste d'emplacements dont les indices sont résolus à la compilation.
     """
-    def __init__(self, parent=None):
+    __slots__ = ('vars', 'parent', 'slot_names', 'slots', 'version')
+
+    # Réserve de cadres d'appel libérés, réutilisés par acquire.
+    _pool: list['EnvFrame'] = []
+
+    def __init__(self, parent=None, slot_names=_NO_SLOTS):
         """
-        Initialise un nouvel environnement, éventuellement avec un parent.
+        Initialise un nouvel environnement, éventuellement avec un parent et
+        la table des emplacements locaux (nom -> indice).
         """
         self.vars = {}
         self.parent: EnvFrame | None = parent
+        self.slot_names: dict[str, int] = slot_names
+        self.slots: list = [None] * len(slot_names)
+        # Version des liaisons par nom du cadre : incrémentée à chaque
+        # modification de `vars`. Tant qu'elle ne change pas, un nom trouvé
+        # dans `vars` y garde la même valeur.
+        self.version = 0
+
+    @classmethod
+    def acquire(cls, parent, slot_names):
+        """
+        Retourne un cadre d'appel vide, pris dans la réserve si possible,
+        sinon nouvellement créé.
+        """
+        pool = cls._pool
+        if not pool:
+            return cls(parent, slot_names)
+        frame = pool.pop()
+        frame.parent = parent
+        frame.slot_names = slot_names
+        frame.slots = [None] * len(slot_names)
+        return frame
+
+    @classmethod
+    def release(cls, frame):
+        """
+        Rend un cadre d'appel à la réserve. Il ne doit plus être référencé,
+        en particulier par une fermeture créée pendant l'appel.
+        """
+        pool = cls._pool
+        if len(pool) < POOL_SIZE:
+            if frame.vars:
+                frame.vars.clear()
+                frame.version += 1
+            frame.parent = None
+            frame.slots = None
+            pool.append(frame)
 
     def lookup(self, name):
         """
@@ -15,7 +65,10 @@ class EnvFrame:
         """
         if name in self.vars:
             return self.vars[name]
-        elif self.parent is not None:
+        slot = self.slot_names.get(name)
+        if slot is not None and self.slots[slot] is not None:
+            return self.slots[slot]
+        if self.parent is not None:
             return self.parent.lookup(name)
         else:
             raise NameError(f"Variable '{name}' non définie.")
@@ -25,11 +78,13 @@ class EnvFrame:
         Insère ou met à jour une variable dans l'environnement courant.
         """
         self.vars[name] = value
+        self.version += 1
 
     def copy_shallow(self):
         """
         Retourne une copie superficielle de l'environnement (variables copiées, même parent).
         """
-        newf = EnvFrame(self.parent)
+        newf = EnvFrame(self.parent, self.slot_names)
         newf.vars = self.vars.copy()
+        newf.slots = self.slots.copy()
         return newf
\ No newline at end of file
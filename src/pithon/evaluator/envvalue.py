@@ -1,34 +1,93 @@
 """Définitions des valeurs pour l'évaluateur Pithon."""
 
-from typing import Union,  Callable
-from dataclasses import dataclass
+from array import array
+from typing import Optional, Union,  Callable
+from dataclasses import dataclass, field
 from pithon.syntax import ( PiFunctionDef,
 )
 from pithon.evaluator.envframe import EnvFrame
 
 PrimitiveFunction = Callable[..., 'EnvValue']
 
-@dataclass
+@dataclass(slots=True)
 class VFunctionClosure:
     """Représente une fermeture de fonction avec son environnement."""
     funcdef: PiFunctionDef
     closure_env: EnvFrame
+    # Compilation JIT (voir pithon.evaluator.jit) : version compilée (None tant
+    # qu'elle n'a pas été tentée, False si impossible) et nombre d'appels.
+    _numba_fn: object = field(default=None, init=False, repr=False, compare=False)
+    _call_count: int = field(default=0, init=False, repr=False, compare=False)
 
     def __str__(self) -> str:
         return f"<function {self.funcdef.name} at {id(self)}>"
 
-@dataclass
 class VList:
-    """Représente une liste de valeurs."""
-    value: list['EnvValue']
+    """
+    Représente une liste de valeurs.
+    Une liste ne contenant que des nombres tous entiers (ou tous flottants)
+    peut être stockée dans un tableau de valeurs brutes ; les éléments sont
+    alors emballés dans un VNumber à la lecture. Accéder à `value` repasse
+    la liste en stockage générique.
+    """
+    __slots__ = ('_items', '_prim')
+    __hash__ = None
+
+    def __init__(self, value: list['EnvValue']):
+        self._items: Optional[list['EnvValue']] = value
+        self._prim: Optional[array] = None
+
+    @classmethod
+    def from_array(cls, prim: array) -> 'VList':
+        """Crée une liste stockée directement dans un tableau de valeurs brutes."""
+        lst = cls.__new__(cls)
+        lst._items = None
+        lst._prim = prim
+        return lst
+
+    @classmethod
+    def specialized(cls, elements: list['EnvValue']) -> 'VList':
+        """Crée une liste en choisissant le stockage le plus compact pour ses éléments."""
+        if elements and all(type(e) is VNumber for e in elements):
+            values = [e.value for e in elements]
+            if all(type(v) is int for v in values):
+                try:
+                    return cls.from_array(array('q', values))
+                except OverflowError:
+                    pass
+            elif all(type(v) is float for v in values):
+                return cls.from_array(array('d', values))
+        return cls(elements)
+
+    @property
+    def value(self) -> list['EnvValue']:
+        if self._prim is not None:
+            # Retour au stockage générique
+            self._items = [box_number(v) for v in self._prim]
+            self._prim = None
+        return self._items  # type: ignore
+
+    def __len__(self) -> int:
+        return len(self._prim) if self._prim is not None else len(self._items)  # type: ignore
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        if self._prim is not None and other._prim is not None:
+            return self._prim == other._prim
+        return self.value == other.value
 
     def __str__(self) -> str:
-        return str(self.value)
+        if self._prim is not None:
+            return str(self._prim.tolist())
+        return str(self._items)
 
     def __repr__(self) -> str:
-        return repr(self.value)
+        if self._prim is not None:
+            return repr(self._prim.tolist())
+        return repr(self._items)
 
-@dataclass
+@dataclass(slots=True)
 class VTuple:
     """Représente un tuple de valeurs."""
     value: tuple['EnvValue', ...]
@@ -39,7 +98,7 @@ class VTuple:
     def __repr__(self) -> str:
         return repr(self.value)
 
-@dataclass
+@dataclass(slots=True)
 class VNumber:
     """Représente un nombre (float)."""
     value: float
@@ -51,7 +110,7 @@ class VNumber:
     def __repr__(self) -> str:
         return repr(self.value)
 
-@dataclass
+@dataclass(slots=True)
 class VBool:
     """Représente une valeur booléenne."""
     value: bool
@@ -62,7 +121,7 @@ class VBool:
     def __repr__(self) -> str:
         return repr(self.value)
 
-@dataclass
+@dataclass(slots=True)
 class VNone:
     """Représente la valeur None."""
     value: None = None
@@ -73,7 +132,24 @@ class VNone:
     def __repr__(self) -> str:
         return repr(self.value)
 
-@dataclass
+# Valeurs partagées, à la manière du cache des petits entiers de CPython :
+# les valeurs Pithon ne sont jamais modifiées sur place.
+VTRUE = VBool(True)
+VFALSE = VBool(False)
+VNONE = VNone()
+_SMALL_NUMBERS = tuple(VNumber(i) for i in range(-5, 257))
+
+def box_number(value: float) -> VNumber:
+    """Emballe un nombre ; les entiers de -5 à 256 sont partagés."""
+    if type(value) is int and -5 <= value <= 256:
+        return _SMALL_NUMBERS[value + 5]
+    return VNumber(value)
+
+def box_bool(value: bool) -> VBool:
+    """Retourne le VBool partagé correspondant à une valeur de vérité."""
+    return VTRUE if value else VFALSE
+
+@dataclass(slots=True)
 class VString:
     """Représente une chaîne de caractères."""
     value: str
@@ -84,16 +160,18 @@ class VString:
     def __repr__(self) -> str:
         return repr(self.value)
 
-@dataclass
+@dataclass(slots=True)
 class VClassDef:
     """Représente une définition de classe avec ses méthodes."""
     name: str
     methods: dict[str, VFunctionClosure]
+    # Méthode __init__, précalculée
+    _init_method: Optional[VFunctionClosure] = field(default=None, init=False, repr=False, compare=False)
 
     def __str__(self) -> str:
         return f"<class {self.name} at {id(self)}>"
 
-@dataclass
+@dataclass(slots=True)
 class VObject:
     """Représente une instance d'une classe avec ses attributs."""
     class_def: VClassDef
@@ -105,7 +183,7 @@ class VObject:
     def __repr__(self) -> str:
         return self.__str__()
 
-@dataclass
+@dataclass(slots=True)
 class VMethodClosure:
     """Représente une méthode liée à une instance."""
     function: VFunctionClosure
@@ -1,22 +1,58 @@
+from typing import Sequence
+from pithon.evaluator import jit
+from pithon.evaluator.compiler import MEMBERSHIP_TYPES, compile_program, compile_node
 from pithon.evaluator.envframe import EnvFrame
-from pithon.evaluator.primitive import check_type, get_primitive_dict
+from pithon.evaluator.primitive import check_type, get_primitive_dict, primitive_range, range_of
 from pithon.syntax import (
     PiAssignment, PiBinaryOperation, PiNumber, PiBool, PiStatement, PiProgram, PiSubscript, PiVariable,
     PiIfThenElse, PiNot, PiAnd, PiOr, PiWhile, PiNone, PiList, PiTuple, PiString,
     PiFunctionDef, PiFunctionCall, PiFor, PiBreak, PiContinue, PiIn, PiReturn,
-    PiClassDef, PiAttribute, PiAttributeAssignment
+    PiClassDef, PiAttribute, PiAttributeAssignment, PiConst
 )
 from pithon.evaluator.envvalue import (
     EnvValue, VFunctionClosure, VList, VNone, VTuple, VNumber, VBool, VString,
-    VClassDef, VObject, VMethodClosure
+    VClassDef, VObject, VMethodClosure, VNONE, VFALSE, box_bool, box_number
 )
 
+# Statuts retournés par l'exécution d'un bloc d'instructions
+NORMAL = 0
+RETURN = 1
+BREAK = 2
+CONTINUE = 3
+
+_BREAK_RESULT = (BREAK, None)
+_CONTINUE_RESULT = (CONTINUE, None)
+
+# Types des nombres bruts (non emballés) manipulés en interne par les
+# opérations arithmétiques ; ils sont emballés dans un VNumber dès qu'ils
+# sortent d'une expression arithmétique.
+_RAW_NUMBERS = frozenset((int, float))
+
+# Types dont la valeur de vérité est celle de leur valeur Python (voir _truthy)
+_TRUTH_TYPES = frozenset((VNumber, VString, VTuple, VNone))
+
+# Arguments d'un appel sans argument, partagés
+_EMPTY_ARGS = ()
+
+# Réserve de cadres d'appel (voir EnvFrame.acquire), méthodes liées une fois
+_acquire = EnvFrame.acquire
+_release = EnvFrame.release
+
+# États du cache en ligne des nœuds PiAttribute
+_IC_MISS = 0
+_IC_ATTRIBUTE = 1
+_IC_METHOD = 2
+
 
 def initial_env() -> EnvFrame:
-    """Crée et retourne l'environnement initial avec les primitives."""
-    env = EnvFrame()
-    env.vars.update(get_primitive_dict())
-    return env
+    """
+    Crée et retourne l'environnement initial. Les primitives sont dans un
+    cadre parent à part, où aucune liaison n'est jamais faite : sa version ne
+    change pas et leurs recherches restent en cache.
+    """
+    primitives = EnvFrame()
+    primitives.vars.update(get_primitive_dict())
+    return EnvFrame(primitives)
 
 
 def lookup(env: EnvFrame, name: str) -> EnvValue:
@@ -29,13 +65,15 @@ def insert(env: EnvFrame, name: str, value: EnvValue) -> None:
     env.insert(name, value)
 
 
+def run(program: PiProgram, env: EnvFrame) -> EnvValue:
+    """Compile puis évalue un programme complet."""
+    return evaluate(compile_program(program), env)
+
+
 def evaluate(node: PiProgram, env: EnvFrame) -> EnvValue:
     """Évalue un programme ou une liste d'instructions."""
     if isinstance(node, list):
-        last_value = VNone(value=None)
-        for stmt in node:
-            last_value = evaluate_stmt(stmt, env)
-        return last_value
+        return _finish(*execute_block(node, env))
     elif isinstance(node, PiStatement):
         return evaluate_stmt(node, env)
     else:
@@ -44,228 +82,463 @@ def evaluate(node: PiProgram, env: EnvFrame) -> EnvValue:
 
 def evaluate_stmt(node: PiStatement, env: EnvFrame) -> EnvValue:
     """Évalue une instruction ou expression Pithon."""
+    handler = _DISPATCH.get(type(node))
+    if handler is None:
+        raise TypeError(f"Type de nœud non supporté : {type(node)}")
+    return handler(node, env)
+
+
+def execute_block(body, env: EnvFrame) -> tuple[int, EnvValue]:
+    """
+    Exécute une suite d'instructions et retourne le couple (statut, valeur).
+    Le statut indique si le bloc s'est terminé normalement ou sur un
+    return, un break ou un continue.
+    """
+    value = VNONE
+    for stmt in body:
+        handler = _EXEC_DISPATCH.get(type(stmt))
+        if handler is None:
+            value = evaluate_stmt(stmt, env)
+        else:
+            status, value = handler(stmt, env)
+            if status != NORMAL:
+                return status, value
+    return NORMAL, value
+
+
+def resolve_handlers(body) -> tuple:
+    """
+    Associe une fois pour toutes à chaque instruction d'un bloc son
+    gestionnaire. Chaque élément est un triplet (gestionnaire, contrôle,
+    instruction) où `contrôle` indique un gestionnaire de _EXEC_DISPATCH, qui
+    retourne un couple (statut, valeur).
+    """
+    handlers = []
+    for stmt in body:
+        handler = _EXEC_DISPATCH.get(type(stmt))
+        if handler is not None:
+            handlers.append((handler, True, stmt))
+        else:
+            # Un nœud inconnu lèvera son erreur à l'exécution, via evaluate_stmt
+            handlers.append((_DISPATCH.get(type(stmt), evaluate_stmt), False, stmt))
+    return tuple(handlers)
+
+
+def execute_handlers(handlers: tuple, env: EnvFrame) -> tuple[int, EnvValue]:
+    """Comme execute_block, pour un bloc déjà résolu par resolve_handlers."""
+    value = VNONE
+    for handler, control, stmt in handlers:
+        if control:
+            status, value = handler(stmt, env)
+            if status != NORMAL:
+                return status, value
+        else:
+            value = handler(stmt, env)
+    return NORMAL, value
 
-    if isinstance(node, PiNumber):
-        return VNumber(node.value)
 
-    elif isinstance(node, PiBool):
-        return VBool(node.value)
+def _finish(status: int, value: EnvValue) -> EnvValue:
+    """
+    Convertit un statut sorti de son contexte en exception de compatibilité.
+    Les appels de fonction l'utilisent pour un break ou un continue placé
+    hors de toute boucle dans le corps de la fonction.
+    """
+    if status == NORMAL:
+        return value
+    if status == RETURN:
+        raise ReturnException(value)
+    if status == BREAK:
+        raise BreakException()
+    raise ContinueException()
 
-    elif isinstance(node, PiNone):
-        return VNone(node.value)
 
-    elif isinstance(node, PiString):
-        return VString(node.value)
+def _eval_number(node: PiNumber, env: EnvFrame) -> EnvValue:
+    return box_number(node.value)
 
-    elif isinstance(node, PiList):
-        elements = [evaluate_stmt(e, env) for e in node.elements]
-        return VList(elements)
 
-    elif isinstance(node, PiTuple):
-        elements = tuple(evaluate_stmt(e, env) for e in node.elements)
-        return VTuple(elements)
+def _eval_bool(node: PiBool, env: EnvFrame) -> EnvValue:
+    return box_bool(node.value)
 
-    elif isinstance(node, PiVariable):
-        return lookup(env, node.name)
 
-    elif isinstance(node, PiBinaryOperation):
-        # Traite l'opération binaire comme un appel de fonction
-        fct_call = PiFunctionCall(
-            function=PiVariable(name=node.operator),
-            args=[node.left, node.right]
-        )
-        return evaluate_stmt(fct_call, env)
+def _eval_none(node: PiNone, env: EnvFrame) -> EnvValue:
+    return VNONE
 
-    elif isinstance(node, PiAssignment):
-        value = evaluate_stmt(node.value, env)
-        insert(env, node.name, value)
-        return value
 
-    elif isinstance(node, PiAttributeAssignment):
-        obj = evaluate_stmt(node.object, env)
-        if not isinstance(obj, VObject):
-            raise TypeError(f"Impossible d'assigner un attribut à un objet de type {type(obj).__name__}")
-        value = evaluate_stmt(node.value, env)
-        obj.attributes[node.attr] = value
-        return value
+def _eval_string(node: PiString, env: EnvFrame) -> EnvValue:
+    return VString(node.value)
+
 
-    elif isinstance(node, PiAttribute):
-        obj = evaluate_stmt(node.object, env)
-        if not isinstance(obj, VObject):
-            raise TypeError(f"Impossible d'accéder à un attribut d'un objet de type {type(obj).__name__}")
+def _eval_const(node: PiConst, env: EnvFrame) -> EnvValue:
+    return node.value
 
-        # Vérifier d'abord les attributs d'instance
-        if node.attr in obj.attributes:
+
+def _eval_list(node: PiList, env: EnvFrame) -> EnvValue:
+    elements = [evaluate_stmt(e, env) for e in node.elements]
+    return VList.specialized(elements)
+
+
+def _eval_tuple(node: PiTuple, env: EnvFrame) -> EnvValue:
+    elements = tuple(evaluate_stmt(e, env) for e in node.elements)
+    return VTuple(elements)
+
+
+def _eval_variable(node: PiVariable, env: EnvFrame) -> EnvValue:
+    if node._slot >= 0:
+        value = env.slots[node._slot]
+        if value is not None:
+            return value
+    # Le cache vaut tant que le cadre où le nom a été trouvé n'a pas changé et
+    # que la recherche y mène encore : aucun cadre entre `env` et lui n'a
+    # depuis reçu de liaison de ce nom.
+    name = node.name
+    frame = node._cached_frame
+    if frame is not None and frame.version == node._cached_version:
+        current = env
+        while current is not frame:
+            if current is None or name in current.vars:
+                break
+            current = current.parent
+        else:
+            return node._cached_value
+    value = lookup(env, name)
+    # Cadre où le nom a été trouvé ; un nom qui est aussi une variable locale
+    # d'un des cadres parcourus n'est pas mis en cache.
+    frame = env
+    while name not in frame.vars:
+        if name in frame.slot_names:
+            return value
+        frame = frame.parent
+    node._cached_frame = frame
+    node._cached_version = frame.version
+    node._cached_value = value
+    return value
+
+
+def _bind(env: EnvFrame, slot: int, name: str, value: EnvValue) -> None:
+    """Lie une variable, dans son emplacement local s'il est connu, sinon par nom."""
+    if slot >= 0:
+        env.slots[slot] = value
+    else:
+        insert(env, name, value)
+
+
+def _eval_binary_operation(node: PiBinaryOperation, env: EnvFrame) -> EnvValue:
+    return _box(_eval_binary_raw(node, env))
+
+
+def _eval_binary_raw(node: PiBinaryOperation, env: EnvFrame):
+    """
+    Évalue une opération binaire sans emballer un résultat numérique : retourne
+    un int/float brut pour l'arithmétique entre nombres, une EnvValue sinon.
+    """
+    left = _eval_operand(node.left, env)
+    right = _eval_operand(node.right, env)
+    # Chemin rapide entre deux nombres
+    num_fn = node._num_fn
+    if num_fn is not None:
+        a = left.value if type(left) is VNumber else left
+        b = right.value if type(right) is VNumber else right
+        if type(a) in _RAW_NUMBERS and type(b) in _RAW_NUMBERS:
+            return num_fn(a, b)
+    # Sinon, appel direct de la primitive de l'opérateur
+    op_fn = node._op_fn
+    if op_fn is None:
+        # Nœud construit hors de compile_program : résolution à la volée
+        compile_node(node)
+        op_fn = node._op_fn
+        if op_fn is None:
+            raise NameError(f"Variable '{node.operator}' non définie.")
+    return op_fn([_box(left), _box(right)])
+
+
+def _eval_operand(node: PiStatement, env: EnvFrame):
+    """Évalue un opérande numérique en laissant les nombres bruts non emballés."""
+    node_type = type(node)
+    if node_type is PiNumber:
+        return node.value
+    if node_type is PiConst:
+        return node.value
+    if node_type is PiBinaryOperation:
+        return _eval_binary_raw(node, env)
+    return evaluate_stmt(node, env)
+
+
+def _box(value):
+    """Emballe un nombre brut dans un VNumber ; laisse les EnvValue intactes."""
+    if type(value) in _RAW_NUMBERS:
+        return box_number(value)
+    return value
+
+
+def _eval_assignment(node: PiAssignment, env: EnvFrame) -> EnvValue:
+    value = evaluate_stmt(node.value, env)
+    _bind(env, node._slot, node.name, value)
+    return value
+
+
+def _eval_attribute_assignment(node: PiAttributeAssignment, env: EnvFrame) -> EnvValue:
+    obj = evaluate_stmt(node.object, env)
+    if not isinstance(obj, VObject):
+        raise TypeError(f"Impossible d'assigner un attribut à un objet de type {type(obj).__name__}")
+    value = evaluate_stmt(node.value, env)
+    obj.attributes[node.attr] = value
+    return value
+
+
+def _eval_attribute(node: PiAttribute, env: EnvFrame) -> EnvValue:
+    obj = evaluate_stmt(node.object, env)
+    if not isinstance(obj, VObject):
+        raise TypeError(f"Impossible d'accéder à un attribut d'un objet de type {type(obj).__name__}")
+
+    # Chemin rapide : le cache en ligne du nœud indique où se trouve l'attribut
+    kind = node._ic_kind
+    if kind == _IC_ATTRIBUTE:
+        try:
             return obj.attributes[node.attr]
+        except KeyError:
+            pass
+    elif kind == _IC_METHOD and obj.class_def is node._ic_class and node.attr not in obj.attributes:
+        # Les méthodes d'une classe ne changent pas après sa définition
+        return VMethodClosure(function=node._ic_method, instance=obj)
 
-        # Puis vérifier les méthodes de la classe
-        if node.attr in obj.class_def.methods:
-            method = obj.class_def.methods[node.attr]
-            return VMethodClosure(function=method, instance=obj)
-
-        raise AttributeError(f"L'objet {obj.class_def.name} n'a pas d'attribut '{node.attr}'")
-
-    elif isinstance(node, PiIfThenElse):
-        cond = evaluate_stmt(node.condition, env)
-        cond = check_type(cond, VBool)
-        branch = node.then_branch if cond.value else node.else_branch
-        last_value = evaluate(branch, env)
-        return last_value
-
-    elif isinstance(node, PiNot):
-        operand = evaluate_stmt(node.operand, env)
-        # Vérifie le type pour l'opérateur 'not'
-        _check_valid_piandor_type(operand)
-        return VBool(not operand.value)  # type: ignore
-
-    elif isinstance(node, PiAnd):
-        left = evaluate_stmt(node.left, env)
-        _check_valid_piandor_type(left)
-        if not left.value:  # type: ignore
-            return left
-        right = evaluate_stmt(node.right, env)
-        _check_valid_piandor_type(right)
-        return right
-
-    elif isinstance(node, PiOr):
-        left = evaluate_stmt(node.left, env)
-        _check_valid_piandor_type(left)
-        if left.value:  # type: ignore
-            return left
-        right = evaluate_stmt(node.right, env)
-        _check_valid_piandor_type(right)
-        return right
-
-    elif isinstance(node, PiWhile):
-        return _evaluate_while(node, env)
-
-    elif isinstance(node, PiFunctionDef):
-        closure = VFunctionClosure(node, env)
-        insert(env, node.name, closure)
-        return VNone(value=None)
-
-    elif isinstance(node, PiClassDef):
-        # Créer un environnement pour la classe
-        class_env = EnvFrame(parent=env)
-
-        # Évaluer les méthodes dans l'environnement de la classe
-        methods = {}
-        for method in node.methods:
-            method_closure = VFunctionClosure(method, class_env)
-            methods[method.name] = method_closure
-
-        # Créer la définition de classe
-        class_def = VClassDef(name=node.name, methods=methods)
-
-        # Insérer la classe dans l'environnement
-        insert(env, node.name, class_def)
-        return VNone(value=None)
-
-    elif isinstance(node, PiReturn):
-        value = evaluate_stmt(node.value, env)
-        raise ReturnException(value)
+    # Vérifier d'abord les attributs d'instance
+    if node.attr in obj.attributes:
+        node._ic_kind = _IC_ATTRIBUTE
+        return obj.attributes[node.attr]
 
-    elif isinstance(node, PiFunctionCall):
-        return _evaluate_function_call(node, env)
+    # Puis vérifier les méthodes de la classe
+    method = obj.class_def.methods.get(node.attr)
+    if method is not None:
+        node._ic_kind = _IC_METHOD
+        node._ic_class = obj.class_def
+        node._ic_method = method
+        return VMethodClosure(function=method, instance=obj)
 
-    elif isinstance(node, PiFor):
-        return _evaluate_for(node, env)
+    node._ic_kind = _IC_MISS
+    raise AttributeError(f"L'objet {obj.class_def.name} n'a pas d'attribut '{node.attr}'")
 
-    elif isinstance(node, PiBreak):
-        raise BreakException()
 
-    elif isinstance(node, PiContinue):
-        raise ContinueException()
+def _eval_if_then_else(node: PiIfThenElse, env: EnvFrame) -> EnvValue:
+    return _finish(*_exec_if_then_else(node, env))
 
-    elif isinstance(node, PiIn):
-        return _evaluate_in(node, env)
 
-    elif isinstance(node, PiSubscript):
-        return _evaluate_subscript(node, env)
+def _exec_if_then_else(node: PiIfThenElse, env: EnvFrame) -> tuple[int, EnvValue]:
+    cond = evaluate_stmt(node.condition, env)
+    branch = node.then_branch if _truthy(cond) else node.else_branch
+    return execute_block(branch, env)
+
+
+def _eval_not(node: PiNot, env: EnvFrame) -> EnvValue:
+    operand = evaluate_stmt(node.operand, env)
+    return box_bool(not _truthy(operand))
+
+
+def _eval_and(node: PiAnd, env: EnvFrame) -> EnvValue:
+    left = evaluate_stmt(node.left, env)
+    if not _truthy(left):
+        return left
+    # Comme en Python, l'opérande droit est retourné tel quel
+    return evaluate_stmt(node.right, env)
+
+
+def _eval_or(node: PiOr, env: EnvFrame) -> EnvValue:
+    left = evaluate_stmt(node.left, env)
+    if _truthy(left):
+        return left
+    # Comme en Python, l'opérande droit est retourné tel quel
+    return evaluate_stmt(node.right, env)
 
-    else:
-        raise TypeError(f"Type de nœud non supporté : {type(node)}")
 
+def _eval_function_def(node: PiFunctionDef, env: EnvFrame) -> EnvValue:
+    if not node._compiled:
+        compile_node(node)
+    if node._body_handlers is None:
+        node._body_handlers = resolve_handlers(node.body)
+    closure = VFunctionClosure(node, env)
+    _bind(env, node._slot, node.name, closure)
+    return VNONE
 
-def _check_valid_piandor_type(obj):
-    """Vérifie que le type est valide pour 'and'/'or'."""
-    if not isinstance(obj, VBool | VNumber | VString | VNone | VList | VTuple):
-        raise TypeError(f"Type non supporté pour l'opérateur 'and': {type(obj).__name__}")
+
+def _eval_class_def(node: PiClassDef, env: EnvFrame) -> EnvValue:
+    # Créer un environnement pour la classe
+    class_env = EnvFrame(parent=env)
+
+    # Évaluer les méthodes dans l'environnement de la classe
+    methods = {}
+    for method in node.methods:
+        if not method._compiled:
+            compile_node(method)
+        if method._body_handlers is None:
+            method._body_handlers = resolve_handlers(method.body)
+        method_closure = VFunctionClosure(method, class_env)
+        methods[method.name] = method_closure
+
+    # Créer la définition de classe
+    class_def = VClassDef(name=node.name, methods=methods)
+    class_def._init_method = methods.get("__init__")
+
+    # Insérer la classe dans l'environnement
+    _bind(env, node._slot, node.name, class_def)
+    return VNONE
+
+
+def _eval_return(node: PiReturn, env: EnvFrame) -> EnvValue:
+    return _finish(*_exec_return(node, env))
+
+
+def _exec_return(node: PiReturn, env: EnvFrame) -> tuple[int, EnvValue]:
+    return RETURN, evaluate_stmt(node.value, env)
+
+
+def _eval_break(node: PiBreak, env: EnvFrame) -> EnvValue:
+    raise BreakException()
+
+
+def _exec_break(node: PiBreak, env: EnvFrame) -> tuple[int, EnvValue]:
+    return _BREAK_RESULT
+
+
+def _eval_continue(node: PiContinue, env: EnvFrame) -> EnvValue:
+    raise ContinueException()
+
+
+def _exec_continue(node: PiContinue, env: EnvFrame) -> tuple[int, EnvValue]:
+    return _CONTINUE_RESULT
+
+
+def _truthy(value: EnvValue) -> bool:
+    """
+    Valeur de vérité d'une valeur Pithon, comme en Python : faux pour False,
+    None, zéro et les séquences vides ; toujours vrai pour les objets,
+    fonctions, classes et primitives.
+    """
+    kind = type(value)
+    if kind is VBool:
+        return value.value
+    if kind is VList:
+        # len ne convertit pas une liste de nombres bruts
+        return len(value) > 0
+    if kind in _TRUTH_TYPES:
+        return bool(value.value)
+    return True
 
 
 def _evaluate_while(node: PiWhile, env: EnvFrame) -> EnvValue:
     """Évalue une boucle while."""
-    last_value = VNone(value=None)
+    return _finish(*_exec_while(node, env))
+
+
+def _exec_while(node: PiWhile, env: EnvFrame) -> tuple[int, EnvValue]:
+    """Exécute une boucle while ; seul un return se propage hors de la boucle."""
+    last_value = VNONE
+    body_handlers = node._body_handlers
+    if body_handlers is None:
+        body_handlers = node._body_handlers = resolve_handlers(node.body)
     while True:
-        cond = evaluate_stmt(node.condition, env)
-        cond = check_type(cond, VBool)
-        if not cond.value:
+        if not _truthy(evaluate_stmt(node.condition, env)):
             break
-        try:
-            last_value = evaluate(node.body, env)
-        except BreakException:
+        status, value = execute_handlers(body_handlers, env)
+        if status == BREAK:
             break
-        except ContinueException:
-            continue
-    return last_value
+        if status == RETURN:
+            return status, value
+        if status == NORMAL:
+            last_value = value
+    return NORMAL, last_value
 
 
 def _evaluate_for(node: PiFor, env: EnvFrame) -> EnvValue:
     """Évalue une boucle for."""
-    iterable_val = evaluate_stmt(node.iterable, env)
-    if not isinstance(iterable_val, (VList, VTuple)):
-        raise TypeError("La boucle for attend une liste ou un tuple.")
-    last_value = VNone(value=None)
-    iterable = iterable_val.value
+    return _finish(*_exec_for(node, env))
+
+
+def _exec_for(node: PiFor, env: EnvFrame) -> tuple[int, EnvValue]:
+    """Exécute une boucle for ; seul un return se propage hors de la boucle."""
+    if node._range_call and evaluate_stmt(node.iterable.function, env) is primitive_range:
+        # for ... in range(...) : parcours de l'intervalle sans construire la liste
+        args = [evaluate_stmt(arg, env) for arg in node.iterable.args]
+        iterable = map(box_number, range_of(args))
+    else:
+        iterable_val = evaluate_stmt(node.iterable, env)
+        if not isinstance(iterable_val, (VList, VTuple)):
+            raise TypeError("La boucle for attend une liste ou un tuple.")
+        if isinstance(iterable_val, VList) and iterable_val._prim is not None:
+            # Liste de nombres bruts : emballage à la volée, sans changer de stockage
+            iterable = map(box_number, iterable_val._prim)
+        else:
+            iterable = iterable_val.value
+    last_value = VNONE
+    body_handlers = node._body_handlers
+    if body_handlers is None:
+        body_handlers = node._body_handlers = resolve_handlers(node.body)
+    slot = node._slot
     for item in iterable:
-        env.insert(node.var, item)  # Pas de nouvel environnement pour la variable de boucle
-        try:
-            last_value = evaluate(node.body, env)
-        except BreakException:
+        _bind(env, slot, node.var, item)  # Pas de nouvel environnement pour la variable de boucle
+        status, value = execute_handlers(body_handlers, env)
+        if status == BREAK:
             break
-        except ContinueException:
-            continue
-    return last_value
+        if status == RETURN:
+            return status, value
+        if status == NORMAL:
+            last_value = value
+    return NORMAL, last_value
 
 
 def _evaluate_subscript(node: PiSubscript, env: EnvFrame) -> EnvValue:
     """Évalue une opération d'indexation (subscript)."""
     collection = evaluate_stmt(node.collection, env)
-    index = evaluate_stmt(node.index, env)
+    index = _eval_operand(node.index, env)
     # Indexation pour liste, tuple ou chaîne
     if isinstance(collection, VList):
-        idx = check_type(index, VNumber)
         try:
-            return collection.value[int(idx.value)]
+            if collection._prim is not None:
+                return box_number(collection._prim[_index_value(index)])
+            return collection.value[_index_value(index)]
         except IndexError:
             raise IndexError("Index de liste hors limites")
     elif isinstance(collection, VTuple):
-        idx = check_type(index, VNumber)
         try:
-            return collection.value[int(idx.value)]
+            return collection.value[_index_value(index)]
         except IndexError:
             raise IndexError("Index de tuple hors limites")
     elif isinstance(collection, VString):
-        idx = check_type(index, VNumber)
         try:
-            return VString(collection.value[int(idx.value)])
+            return VString(collection.value[_index_value(index)])
         except IndexError:
             raise IndexError("Index de chaîne hors limites")
     else:
         raise TypeError("L'indexation n'est supportée que pour les listes, tuples et chaînes.")
 
 
+def _index_value(index) -> int:
+    """Convertit un index (nombre brut ou VNumber) en entier Python."""
+    if type(index) is int:
+        return index
+    if type(index) in _RAW_NUMBERS:
+        return int(index)
+    return int(check_type(index, VNumber).value)
+
+
 def _evaluate_in(node: PiIn, env: EnvFrame) -> EnvValue:
     """Évalue l'opérateur 'in'."""
+    prebuilt = node._prebuilt_set
+    if prebuilt is not None:
+        # Conteneur littéral : recherche dans l'ensemble précalculé
+        element = evaluate_stmt(node.element, env)
+        kind = type(element)
+        return box_bool(kind in MEMBERSHIP_TYPES and (kind, element.value) in prebuilt)
     container = evaluate_stmt(node.container, env)
     element = evaluate_stmt(node.element, env)
+    if isinstance(container, VList) and container._prim is not None:
+        # Seul un VNumber peut être égal à un élément d'une liste de nombres bruts
+        return box_bool(type(element) is VNumber and element.value in container._prim)
     if isinstance(container, (VList, VTuple)):
-        return VBool(element in container.value)
+        return box_bool(element in container.value)
     elif isinstance(container, VString):
         if isinstance(element, VString):
-            return VBool(element.value in container.value)
+            return box_bool(element.value in container.value)
         else:
-            return VBool(False)
+            return VFALSE
     else:
         raise TypeError("'in' n'est supporté que pour les listes et chaînes.")
 
@@ -273,111 +546,138 @@ def _evaluate_in(node: PiIn, env: EnvFrame) -> EnvValue:
 def _evaluate_function_call(node: PiFunctionCall, env: EnvFrame) -> EnvValue:
     """Évalue un appel de fonction (primitive, définie par l'utilisateur, ou constructeur de classe)."""
     func_val = evaluate_stmt(node.function, env)
-    args = [evaluate_stmt(arg, env) for arg in node.args]
+    arg_nodes = node._args_tuple
+    if arg_nodes is None:
+        arg_nodes = node._args_tuple = tuple(node.args)
+    # Les appels à 0, 1 ou 2 arguments, les plus fréquents, n'allouent pas de liste
+    count = len(arg_nodes)
+    if count == 0:
+        args = _EMPTY_ARGS
+    elif count == 1:
+        args = (evaluate_stmt(arg_nodes[0], env),)
+    elif count == 2:
+        args = (evaluate_stmt(arg_nodes[0], env), evaluate_stmt(arg_nodes[1], env))
+    else:
+        args = [evaluate_stmt(arg, env) for arg in arg_nodes]
+    call = _CALL_DISPATCH.get(type(func_val))
+    if call is not None:
+        return call(func_val, args)
     # Fonction primitive
     if callable(func_val):
         return func_val(args)
+    raise TypeError(f"Tentative d'appel d'un objet non-fonction de type {type(func_val).__name__}")
 
-    # Constructeur de classe
-    if isinstance(func_val, VClassDef):
-        # Créer une nouvelle instance
-        instance = VObject(class_def=func_val, attributes={})
-
-        # Appeler __init__ si elle existe
-        if "__init__" in func_val.methods:
-            init_method = func_val.methods["__init__"]
-            # Créer l'environnement d'appel pour __init__
-            call_env = EnvFrame(parent=init_method.closure_env)
-
-            # Le premier argument est 'self'
-            if len(init_method.funcdef.arg_names) > 0:
-                call_env.insert(init_method.funcdef.arg_names[0], instance)
-
-            # Ajouter les autres arguments
-            for i, arg_name in enumerate(init_method.funcdef.arg_names[1:], 1):
-                if i-1 < len(args):
-                    call_env.insert(arg_name, args[i-1])
-                else:
-                    raise TypeError(f"Argument manquant pour __init__: {arg_name}")
-
-            # Exécuter __init__
-            try:
-                for stmt in init_method.funcdef.body:
-                    evaluate_stmt(stmt, call_env)
-            except ReturnException:
-                pass  # __init__ peut retourner quelque chose, on l'ignore
-
-        return instance
-
-    # Méthode liée
-    if isinstance(func_val, VMethodClosure):
-        funcdef = func_val.function.funcdef
-        closure_env = func_val.function.closure_env
-        instance = func_val.instance
-
-        # Créer l'environnement d'appel
-        call_env = EnvFrame(parent=closure_env)
-
-        # Le premier argument est 'self'
-        if len(funcdef.arg_names) > 0:
-            call_env.insert(funcdef.arg_names[0], instance)
-
-        # Ajouter les autres arguments
-        for i, arg_name in enumerate(funcdef.arg_names[1:], 1):
-            if i-1 < len(args):
-                call_env.insert(arg_name, args[i-1])
-            else:
-                raise TypeError(f"Argument manquant pour la méthode {funcdef.name}: {arg_name}")
-
-        # Gérer varargs si nécessaire
-        if funcdef.vararg:
-            varargs = VList(args[len(funcdef.arg_names)-1:])
-            call_env.insert(funcdef.vararg, varargs)
-        elif len(args) > len(funcdef.arg_names) - 1:
-            raise TypeError("Trop d'arguments pour la méthode.")
-
-        # Exécuter la méthode
-        result = VNone(value=None)
-        try:
-            for stmt in funcdef.body:
-                result = evaluate_stmt(stmt, call_env)
-        except ReturnException as ret:
-            return ret.value
-
-        return result
-
-    # Fonction utilisateur
-    if isinstance(func_val, VFunctionClosure):
-        funcdef = func_val.funcdef
-        closure_env = func_val.closure_env
-        call_env = EnvFrame(parent=closure_env)
-
-        # Ajouter les arguments
-        for i, arg_name in enumerate(funcdef.arg_names):
-            if i < len(args):
-                call_env.insert(arg_name, args[i])
-            else:
-                raise TypeError(f"Argument manquant pour la fonction {funcdef.name}: {arg_name}")
-
-        # Gérer varargs
-        if funcdef.vararg:
-            varargs = VList(args[len(funcdef.arg_names):])
-            call_env.insert(funcdef.vararg, varargs)
-        elif len(args) > len(funcdef.arg_names):
-            raise TypeError("Trop d'arguments pour la fonction.")
-
-        # Exécuter la fonction
-        result = VNone(value=None)
+
+def _call_class(func_val: VClassDef, args: Sequence[EnvValue]) -> EnvValue:
+    """Appelle le constructeur d'une classe."""
+    # Créer une nouvelle instance
+    instance = VObject(class_def=func_val, attributes={})
+
+    # Appeler __init__ si elle existe
+    init_method = func_val._init_method
+    if init_method is not None:
+        init_def = init_method.funcdef
+        # Les arguments en trop sont ignorés
+        arg_names = init_def._non_self_arg_names
+        count = len(arg_names)
+        if len(args) < count:
+            raise TypeError(f"Argument manquant pour __init__: {arg_names[len(args)]}")
+
+        # Créer l'environnement d'appel pour __init__ : 'self' puis les
+        # paramètres occupent les premiers emplacements locaux, dans l'ordre
+        call_env = _acquire(init_method.closure_env, init_def._slot_names)
+        if init_def._arg_names:
+            call_env.slots[0] = instance
+        call_env.slots[1:1 + count] = args[:count]
+
+        # Exécuter __init__ (une valeur retournée est ignorée)
         try:
-            for stmt in funcdef.body:
-                result = evaluate_stmt(stmt, call_env)
-        except ReturnException as ret:
-            return ret.value
+            status, value = execute_handlers(init_def._body_handlers, call_env)
+            if status > RETURN:
+                _finish(status, value)
+        finally:
+            if init_def._poolable:
+                _release(call_env)
+
+    return instance
+
+
+def _call_method(func_val: VMethodClosure, args: Sequence[EnvValue]) -> EnvValue:
+    """Appelle une méthode liée à une instance."""
+    funcdef = func_val.function.funcdef
+    closure_env = func_val.function.closure_env
+
+    # Vérifier le nombre d'arguments ('self' n'en fait pas partie)
+    arg_names = funcdef._non_self_arg_names
+    count = len(arg_names)
+    if len(args) < count:
+        raise TypeError(f"Argument manquant pour la méthode {funcdef.name}: {arg_names[len(args)]}")
+    if not funcdef.vararg and len(args) > len(funcdef._arg_names) - 1:
+        raise TypeError("Trop d'arguments pour la méthode.")
+
+    # Créer l'environnement d'appel : 'self' puis les autres paramètres
+    call_env = _acquire(closure_env, funcdef._slot_names)
+    if funcdef._arg_names:
+        call_env.slots[0] = func_val.instance
+    call_env.slots[1:1 + count] = args[:count]
+
+    # Gérer varargs si nécessaire
+    if funcdef.vararg:
+        call_env.slots[funcdef._slot_names[funcdef.vararg]] = VList(list(args[count:]))
+
+    # Exécuter la méthode
+    try:
+        status, result = execute_handlers(funcdef._body_handlers, call_env)
+        if status > RETURN:
+            _finish(status, result)
+    finally:
+        if funcdef._poolable:
+            _release(call_env)
+    return result
+
+
+def _call_function(func_val: VFunctionClosure, args: Sequence[EnvValue]) -> EnvValue:
+    """Appelle une fonction définie par l'utilisateur."""
+    # Version compilée des fonctions purement numériques
+    if jit.enabled:
+        result = jit.try_call(func_val, args)
+        if result is not None:
+            return result
+
+    funcdef = func_val.funcdef
+    closure_env = func_val.closure_env
+
+    # Vérifier le nombre d'arguments
+    arg_names = funcdef._arg_names
+    count = len(arg_names)
+    if len(args) < count:
+        raise TypeError(f"Argument manquant pour la fonction {funcdef.name}: {arg_names[len(args)]}")
+    if not funcdef.vararg and len(args) > count:
+        raise TypeError("Trop d'arguments pour la fonction.")
+
+    call_env = _acquire(closure_env, funcdef._slot_names)
+
+    # Les paramètres occupent les premiers emplacements locaux, dans l'ordre
+    if funcdef.vararg:
+        call_env.slots[:count] = args[:count]
+        call_env.slots[funcdef._slot_names[funcdef.vararg]] = VList(list(args[count:]))
+    else:
+        call_env.slots[:count] = args
 
-        return result
+    # Exécuter la fonction
+    try:
+        status, result = execute_handlers(funcdef._body_handlers, call_env)
+        if status > RETURN:
+            _finish(status, result)
+    finally:
+        if funcdef._poolable:
+            _release(call_env)
+    return result
 
-    raise TypeError(f"Tentative d'appel d'un objet non-fonction de type {type(func_val).__name__}")
 
+# Les exceptions suivantes ne servent plus au flot de contrôle interne (voir
+# execute_block) ; elles ne sont levées que lorsqu'un return, break ou continue
+# est évalué hors de tout contexte qui le traite.
 
 class ReturnException(Exception):
     """Exception pour retourner une valeur depuis une fonction."""
@@ -393,3 +693,53 @@ class BreakException(Exception):
 class ContinueException(Exception):
     """Exception pour passer à l'itération suivante (continue)."""
     pass
+
+
+# Gestionnaire de chaque type de nœud pour evaluate_stmt.
+_DISPATCH = {
+    PiNumber: _eval_number,
+    PiBool: _eval_bool,
+    PiNone: _eval_none,
+    PiString: _eval_string,
+    PiConst: _eval_const,
+    PiList: _eval_list,
+    PiTuple: _eval_tuple,
+    PiVariable: _eval_variable,
+    PiBinaryOperation: _eval_binary_operation,
+    PiAssignment: _eval_assignment,
+    PiAttributeAssignment: _eval_attribute_assignment,
+    PiAttribute: _eval_attribute,
+    PiIfThenElse: _eval_if_then_else,
+    PiNot: _eval_not,
+    PiAnd: _eval_and,
+    PiOr: _eval_or,
+    PiWhile: _evaluate_while,
+    PiFunctionDef: _eval_function_def,
+    PiClassDef: _eval_class_def,
+    PiReturn: _eval_return,
+    PiFunctionCall: _evaluate_function_call,
+    PiFor: _evaluate_for,
+    PiBreak: _eval_break,
+    PiContinue: _eval_continue,
+    PiIn: _evaluate_in,
+    PiSubscript: _evaluate_subscript,
+}
+
+# Gestionnaires des instructions de contrôle au sein d'un bloc ; les autres
+# instructions sont évaluées comme des expressions.
+_EXEC_DISPATCH = {
+    PiIfThenElse: _exec_if_then_else,
+    PiWhile: _exec_while,
+    PiFor: _exec_for,
+    PiReturn: _exec_return,
+    PiBreak: _exec_break,
+    PiContinue: _exec_continue,
+}
+
+# Appel selon le type de la valeur appelée ; les primitives (fonctions Python)
+# sont traitées à part.
+_CALL_DISPATCH = {
+    VClassDef: _call_class,
+    VMethodClosure: _call_method,
+    VFunctionClosure: _call_function,
+}
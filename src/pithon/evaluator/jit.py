@@ -0,0 +1,353 @@
+"""
+Compilation à la volée (JIT) des fonctions Pithon purement numériques avec Numba.
+
+Une fonction dont le corps ne manipule que des entiers et des booléens
+locaux est traduite en source Python puis compilée par `numba.njit` une fois
+appelée JIT_THRESHOLD fois. Les entiers y sont des entiers machine 64 bits :
+un dépassement est détecté et l'appel est alors refait par l'interpréteur.
+La compilation n'est active que si `enabled` vaut True (option --jit de la
+ligne de commande). Sans Numba installé, tout reste interprété.
+"""
+
+from typing import Sequence
+from pithon.evaluator.envvalue import EnvValue, VBool, VFunctionClosure, VNumber, box_bool, box_number
+from pithon.evaluator.primitive import primitive_range
+from pithon.syntax import (
+    PiAnd, PiAssignment, PiBinaryOperation, PiBool, PiBreak, PiConst, PiContinue, PiFor,
+    PiFunctionCall, PiFunctionDef, PiIfThenElse, PiNot, PiNumber, PiOr, PiReturn,
+    PiVariable, PiWhile
+)
+
+# Module numba, importé à la première compilation : son import est coûteux
+# (None : pas encore tenté, False : Numba absent).
+_numba = None
+
+# Active la compilation des fonctions numériques (désactivée par défaut).
+enabled = False
+
+# Nombre d'appels à partir duquel une fonction est compilée.
+JIT_THRESHOLD = 50
+
+_ARITHMETIC = ('+', '-', '*', '%')
+
+# Opérations vérifiées utilisées par le source généré pour + - *
+_CHECKED_OPERATIONS = {'+': '_add', '-': '_sub', '*': '_mul'}
+
+# Bornes des entiers machine 64 bits
+_INT64_MIN = -2 ** 63
+_INT64_MAX = 2 ** 63 - 1
+
+# Définitions des opérations vérifiées, placées en tête du source généré.
+# Les bornes sont testées avant le calcul, qui ne quitte donc jamais les
+# entiers 64 bits (Numba ne signale pas les dépassements).
+_CHECKED_SOURCE = f'''\
+_MAX = {_INT64_MAX}
+_MIN = -_MAX - 1
+
+def _add(a, b):
+    if (b > 0 and a > _MAX - b) or (b < 0 and a < _MIN - b):
+        raise OverflowError()
+    return a + b
+
+def _sub(a, b):
+    if (b < 0 and a > _MAX + b) or (b > 0 and a < _MIN + b):
+        raise OverflowError()
+    return a - b
+
+def _mul(a, b):
+    if a > 0:
+        if (b > 0 and a > _MAX // b) or (b < -1 and a > _MIN // b):
+            raise OverflowError()
+    elif a < 0:
+        if b > 0:
+            if a < -1 and b > _MIN // a:
+                raise OverflowError()
+        elif b < 0:
+            if a == _MIN or b == _MIN or -a > _MAX // -b:
+                raise OverflowError()
+    return a * b
+
+'''
+
+_COMPARISONS = ('==', '!=', '<', '<=', '>', '>=')
+
+# Natures des expressions reconnues par l'analyse
+_INT = 'int'
+_BOOL = 'bool'
+
+
+class NotCompilable(Exception):
+    """Levée lorsqu'une fonction sort du sous-ensemble numérique compilable."""
+    pass
+
+
+def try_call(closure: VFunctionClosure, args: Sequence[EnvValue]) -> EnvValue | None:
+    """
+    Appelle la version compilée d'une fonction si elle existe (en la compilant
+    au besoin). Retourne None lorsque l'appel doit être interprété.
+    """
+    if closure._numba_fn is False:
+        return None
+    if closure._numba_fn is None:
+        closure._call_count += 1
+        if closure._call_count < JIT_THRESHOLD or not _load_numba():
+            return None
+        closure._numba_fn = _compile(closure)
+        if closure._numba_fn is False:
+            return None
+        first_call = True
+    else:
+        first_call = False
+
+    funcdef = closure.funcdef
+    if len(args) != len(funcdef.arg_names):
+        return None
+    raw_args = []
+    for arg in args:
+        if type(arg) is not VNumber or type(arg.value) is not int:
+            return None
+        if not _INT64_MIN <= arg.value <= _INT64_MAX:
+            return None
+        raw_args.append(arg.value)
+
+    fn, returns_bool, uses_range = closure._numba_fn
+    # Le code compilé suppose que range est la primitive : à vérifier à
+    # chaque appel, range pouvant être redéfini après la compilation.
+    if uses_range and not _range_is_primitive(closure):
+        return None
+    try:
+        result = fn(*raw_args)
+    except OverflowError:
+        # Dépassement des entiers 64 bits : l'interpréteur refait le calcul
+        return None
+    except Exception:
+        # Erreur de typage à la première exécution : la fonction reste
+        # interprétée. Les erreurs suivantes (division par zéro...) sont
+        # reproduites par l'interpréteur, avec ses messages.
+        if first_call:
+            closure._numba_fn = False
+        return None
+    if returns_bool:
+        return box_bool(result)
+    return box_number(int(result))
+
+
+def _load_numba():
+    """Importe Numba au premier besoin ; retourne le module, ou False s'il est absent."""
+    global _numba
+    if _numba is None:
+        try:
+            import numba
+            _numba = numba
+        except ImportError:
+            _numba = False
+    return _numba
+
+
+def _range_is_primitive(closure: VFunctionClosure) -> bool:
+    """Indique si range désigne la primitive dans l'environnement de la fonction."""
+    try:
+        return closure.closure_env.lookup('range') is primitive_range
+    except NameError:
+        return False
+
+
+def _compile(closure: VFunctionClosure):
+    """
+    Retourne (fonction compilée, retourne_un_booléen, utilise_range), ou False
+    si impossible.
+    """
+    transpiler = _Transpiler(closure.funcdef)
+    try:
+        source, returns_bool = transpiler.run()
+    except NotCompilable:
+        return False
+    numba = _load_numba()
+    namespace: dict = {}
+    exec(source, namespace)
+    for name in _CHECKED_OPERATIONS.values():
+        namespace[name] = numba.njit(namespace[name])
+    return numba.njit(namespace['_pithon_jit']), returns_bool, transpiler.uses_range
+
+
+def transpile(funcdef: PiFunctionDef) -> tuple[str, bool]:
+    """
+    Traduit une fonction numérique en source Python et indique si elle
+    retourne un booléen. Lève NotCompilable si la fonction n'est pas
+    purement numérique.
+    """
+    return _Transpiler(funcdef).run()
+
+
+class _Transpiler:
+    """Analyse et traduction d'une fonction numérique."""
+
+    def __init__(self, funcdef: PiFunctionDef):
+        self.funcdef = funcdef
+        self.kinds: dict[str, str] = {name: _INT for name in funcdef.arg_names}
+        # Variables affectées sur tous les chemins menant au point courant
+        self.assigned: set[str] = set(funcdef.arg_names)
+        self.return_kind: str | None = None
+        self.uses_range = False
+        self.lines: list[str] = []
+
+    def run(self) -> tuple[str, bool]:
+        funcdef = self.funcdef
+        if funcdef.vararg:
+            raise NotCompilable("paramètre variadique")
+        if not funcdef.body or not isinstance(funcdef.body[-1], PiReturn):
+            raise NotCompilable("la fonction doit se terminer par un return")
+        params = ", ".join(_local(name) for name in funcdef.arg_names)
+        self.lines.append(f"def _pithon_jit({params}):")
+        self.block(funcdef.body, 1, in_loop=False)
+        return _CHECKED_SOURCE + "\n".join(self.lines) + "\n", self.return_kind == _BOOL
+
+    def emit(self, depth: int, line: str) -> None:
+        self.lines.append("    " * depth + line)
+
+    def block(self, body, depth: int, in_loop: bool) -> bool:
+        """Traduit une suite d'instructions ; retourne True si elle ne se termine jamais normalement."""
+        if not body:
+            self.emit(depth, "pass")
+        for stmt in body:
+            if self.stmt(stmt, depth, in_loop):
+                # La suite du bloc est inaccessible
+                return True
+        return False
+
+    def stmt(self, node, depth: int, in_loop: bool) -> bool:
+        """Traduit une instruction ; retourne True si elle interrompt le bloc (return, break, continue)."""
+        if isinstance(node, PiAssignment):
+            code, kind = self.expr(node.value)
+            self.bind(node.name, kind)
+            self.assigned.add(node.name)
+            self.emit(depth, f"{_local(node.name)} = {code}")
+        elif isinstance(node, PiReturn):
+            code, kind = self.expr(node.value)
+            if self.return_kind not in (None, kind):
+                raise NotCompilable("types de retour incompatibles")
+            self.return_kind = kind
+            self.emit(depth, f"return {code}")
+            return True
+        elif isinstance(node, PiIfThenElse):
+            self.emit(depth, f"if {self.condition(node.condition)}:")
+            before = self.assigned
+            self.assigned = set(before)
+            then_stops = self.block(node.then_branch, depth + 1, in_loop)
+            then_assigned = self.assigned
+            self.assigned = set(before)
+            else_stops = False
+            if node.else_branch:
+                self.emit(depth, "else:")
+                else_stops = self.block(node.else_branch, depth + 1, in_loop)
+            # Après le if, seules comptent les branches qui s'y poursuivent
+            if then_stops and else_stops:
+                return True
+            if else_stops:
+                self.assigned = then_assigned
+            elif not then_stops:
+                self.assigned &= then_assigned
+        elif isinstance(node, PiWhile):
+            self.emit(depth, f"while {self.condition(node.condition)}:")
+            self.loop_body(node.body, depth + 1)
+        elif isinstance(node, PiFor):
+            self.bind(node.var, _INT)
+            self.emit(depth, f"for {_local(node.var)} in {self.range_call(node.iterable)}:")
+            self.loop_body(node.body, depth + 1, node.var)
+        elif isinstance(node, PiBreak) and in_loop:
+            self.emit(depth, "break")
+            return True
+        elif isinstance(node, PiContinue) and in_loop:
+            self.emit(depth, "continue")
+            return True
+        else:
+            raise NotCompilable(f"instruction non supportée : {type(node).__name__}")
+        return False
+
+    def loop_body(self, body, depth: int, var: str | None = None) -> None:
+        # Le corps peut ne jamais s'exécuter : ses affectations (et la variable
+        # de boucle) ne sont pas acquises après la boucle.
+        before = self.assigned
+        self.assigned = set(before)
+        if var is not None:
+            self.assigned.add(var)
+        self.block(body, depth, in_loop=True)
+        self.assigned = before
+
+    def bind(self, name: str, kind: str) -> None:
+        if self.kinds.setdefault(name, kind) != kind:
+            raise NotCompilable(f"type incompatible pour {name}")
+
+    def range_call(self, node) -> str:
+        if not (isinstance(node, PiFunctionCall)
+                and isinstance(node.function, PiVariable)
+                and node.function.name == 'range'
+                and node.function.name not in self.funcdef._slot_names
+                and len(node.args) in (1, 2)):
+            raise NotCompilable("seules les boucles sur range(...) sont supportées")
+        self.uses_range = True
+        bounds = [self.int_expr(arg) for arg in node.args]
+        return f"range({', '.join(bounds)})"
+
+    def condition(self, node) -> str:
+        # Un entier est vrai s'il est non nul, comme en Pithon
+        code, _ = self.expr(node)
+        return code
+
+    def int_expr(self, node) -> str:
+        code, kind = self.expr(node)
+        if kind != _INT:
+            raise NotCompilable("entier attendu")
+        return code
+
+    def expr(self, node) -> tuple[str, str]:
+        if isinstance(node, PiBool):
+            return repr(bool(node.value)), _BOOL
+        if isinstance(node, PiNumber):
+            if type(node.value) is not int:
+                raise NotCompilable("seuls les entiers sont supportés")
+            return repr(node.value), _INT
+        if isinstance(node, PiConst):
+            # Constante précalculée à la compilation
+            value = node.value
+            if type(value) is VBool:
+                return repr(bool(value.value)), _BOOL
+            if type(value) is VNumber and type(value.value) is int:
+                return repr(value.value), _INT
+            raise NotCompilable("constante non numérique")
+        if isinstance(node, PiVariable):
+            kind = self.kinds.get(node.name)
+            if kind is None:
+                raise NotCompilable(f"variable non locale : {node.name}")
+            if node.name not in self.assigned:
+                raise NotCompilable(f"variable pas toujours affectée : {node.name}")
+            return _local(node.name), kind
+        if isinstance(node, PiBinaryOperation):
+            left, left_kind = self.expr(node.left)
+            right, right_kind = self.expr(node.right)
+            if node.operator in _ARITHMETIC and left_kind == right_kind == _INT:
+                checked = _CHECKED_OPERATIONS.get(node.operator)
+                if checked is not None:
+                    return f"{checked}({left}, {right})", _INT
+                return f"({left} {node.operator} {right})", _INT
+            if node.operator in _COMPARISONS and left_kind == right_kind:
+                if left_kind == _BOOL and node.operator not in ('==', '!='):
+                    raise NotCompilable("comparaison d'ordre entre booléens")
+                return f"({left} {node.operator} {right})", _BOOL
+            raise NotCompilable(f"opération non supportée : {node.operator}")
+        if isinstance(node, PiNot):
+            operand, _ = self.expr(node.operand)
+            return f"(not {operand})", _BOOL
+        if isinstance(node, (PiAnd, PiOr)):
+            left, left_kind = self.expr(node.left)
+            right, right_kind = self.expr(node.right)
+            if left_kind != right_kind:
+                raise NotCompilable("opérandes de types différents")
+            keyword = "and" if isinstance(node, PiAnd) else "or"
+            return f"({left} {keyword} {right})", left_kind
+        raise NotCompilable(f"expression non supportée : {type(node).__name__}")
+
+
+def _local(name: str) -> str:
+    """Nom Python d'une variable locale Pithon dans le source généré."""
+    return f"v_{name}"
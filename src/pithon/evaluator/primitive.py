@@ -3,8 +3,11 @@ Fonctions primitives pour l'évaluateur Pithon.
 Contient les opérations arithmétiques, comparaisons et fonctions utilitaires de base.
 """
 
+from array import array
 from typing import Any, Type, TypeVar
-from pithon.evaluator.envvalue import EnvValue, VList, VNone, VTuple, VNumber, VBool, VString
+from pithon.evaluator.envvalue import (
+    EnvValue, VList, VNone, VTuple, VNumber, VBool, VString, VNONE, box_bool, box_number
+)
 
 T = TypeVar('T')
 def check_type(obj: Any, mytype: Type[T]) -> T:
@@ -21,7 +24,7 @@ def primitive_add(args: list[EnvValue]):
     if isinstance(a, VTuple) and isinstance(b, VTuple):
         return VTuple(a.value + b.value)
     if isinstance(a, VNumber) and isinstance(b, VNumber):
-        return VNumber(a.value + b.value)
+        return box_number(a.value + b.value)
     if isinstance(a, VString) and isinstance(b, VString):
         return VString(a.value + b.value)
     raise TypeError(f"Addition non supportée entre {type(a).__name__} et {type(b).__name__}")
@@ -30,7 +33,7 @@ def primitive_sub(args: list[EnvValue]):
     """Soustrait deux nombres."""
     a, b = args
     if isinstance(a, VNumber) and isinstance(b, VNumber):
-        return VNumber(a.value - b.value)
+        return box_number(a.value - b.value)
     raise TypeError(f"Soustraction non supportée entre {type(a).__name__} et {type(b).__name__}")
 
 def primitive_mul(args: list[EnvValue]):
@@ -38,7 +41,7 @@ def primitive_mul(args: list[EnvValue]):
     a, b = args
     # String/List/Tuple repetition: str * int, list * int, tuple * int
     if isinstance(a, VNumber) and isinstance(b, VNumber):
-        return VNumber(a.value * b.value)
+        return box_number(a.value * b.value)
     # Support for repetition operations
     if isinstance(a, VList) and isinstance(b, VNumber):
         return VList(a.value * int(b.value))
@@ -60,7 +63,7 @@ def primitive_div(args: list[EnvValue]):
     if isinstance(a, VNumber) and isinstance(b, VNumber):
         if b.value == 0:
             raise ZeroDivisionError("Division par zéro")
-        return VNumber(a.value / b.value)
+        return box_number(a.value / b.value)
     raise TypeError(f"Division non supportée entre {type(a).__name__} et {type(b).__name__}")
 
 def primitive_mod(args: list[EnvValue]):
@@ -69,63 +72,63 @@ def primitive_mod(args: list[EnvValue]):
     if isinstance(a, VNumber) and isinstance(b, VNumber):
         if b.value == 0:
             raise ZeroDivisionError("Modulo par zéro")
-        return VNumber(a.value % b.value)
+        return box_number(a.value % b.value)
     raise TypeError(f"Modulo non supporté entre {type(a).__name__} et {type(b).__name__}")
 
 def primitive_eq(args: list[EnvValue]):
     """Teste l'égalité entre deux valeurs."""
     a, b = args
-    return VBool(a == b)
+    return box_bool(a == b)
 
 def primitive_neq(args: list[EnvValue]):
     """Teste la différence entre deux valeurs."""
     a, b = args
-    return VBool(a != b)
+    return box_bool(a != b)
 
 def primitive_lt(args: list[EnvValue]):
     """Teste si la première valeur est inférieure à la seconde (nombres ou chaînes)."""
     a, b = args
     if isinstance(a, VNumber) and isinstance(b, VNumber):
-        return VBool(a.value < b.value)
+        return box_bool(a.value < b.value)
     if isinstance(a, VString) and isinstance(b, VString):
-        return VBool(a.value < b.value)
+        return box_bool(a.value < b.value)
     raise TypeError(f"Comparaison '<' non supportée entre {type(a).__name__} et {type(b).__name__}")
 
 def primitive_lte(args: list[EnvValue]):
     """Teste si la première valeur est inférieure ou égale à la seconde (nombres ou chaînes)."""
     a, b = args
     if isinstance(a, VNumber) and isinstance(b, VNumber):
-        return VBool(a.value <= b.value)
+        return box_bool(a.value <= b.value)
     if isinstance(a, VString) and isinstance(b, VString):
-        return VBool(a.value <= b.value)
+        return box_bool(a.value <= b.value)
     raise TypeError(f"Comparaison '<=' non supportée entre {type(a).__name__} et {type(b).__name__}")
 
 def primitive_gt(args: list[EnvValue]):
     """Teste si la première valeur est supérieure à la seconde (nombres ou chaînes)."""
     a, b = args
     if isinstance(a, VNumber) and isinstance(b, VNumber):
-        return VBool(a.value > b.value)
+        return box_bool(a.value > b.value)
     if isinstance(a, VString) and isinstance(b, VString):
-        return VBool(a.value > b.value)
+        return box_bool(a.value > b.value)
     raise TypeError(f"Comparaison '>' non supportée entre {type(a).__name__} et {type(b).__name__}")
 
 def primitive_gte(args: list[EnvValue]):
     """Teste si la première valeur est supérieure ou égale à la seconde (nombres ou chaînes)."""
     a, b = args
     if isinstance(a, VNumber) and isinstance(b, VNumber):
-        return VBool(a.value >= b.value)
+        return box_bool(a.value >= b.value)
     if isinstance(a, VString) and isinstance(b, VString):
-        return VBool(a.value >= b.value)
+        return box_bool(a.value >= b.value)
     raise TypeError(f"Comparaison '>=' non supportée entre {type(a).__name__} et {type(b).__name__}")
 
 def primitive_print(args: list[EnvValue]):
     """Affiche la valeur passée en argument."""
     v, = args
     print(v)
-    return VNone(value=None)
+    return VNONE
 
-def primitive_range(args: list[EnvValue]):
-    """Crée une liste de nombres dans un intervalle spécifié."""
+def range_of(args: list[EnvValue]) -> range:
+    """Retourne l'intervalle décrit par les arguments de 'range'."""
     if len(args) == 1:
         start = 0
         end = check_type(args[0], VNumber).value
@@ -134,7 +137,15 @@ def primitive_range(args: list[EnvValue]):
         end = check_type(args[1], VNumber).value
     else:
         raise TypeError("La fonction 'range' attend 1 ou 2 arguments.")
-    return VList([VNumber(i) for i in range(int(start), int(end))])
+    return range(int(start), int(end))
+
+def primitive_range(args: list[EnvValue]):
+    """Crée une liste de nombres dans un intervalle spécifié."""
+    values = range_of(args)
+    try:
+        return VList.from_array(array('q', values))
+    except OverflowError:
+        return VList([box_number(i) for i in values])
 
 def primitive_str(args: list[EnvValue]):
     """Convertit une valeur en chaîne de caractères."""
@@ -148,6 +159,39 @@ def primitive_str(args: list[EnvValue]):
     else:
         raise TypeError(f"Type non supporté pour 'str': {type(value).__name__}")
 
+def number_div(a, b):
+    """Divise deux nombres bruts, lève une erreur si division par zéro."""
+    if b == 0:
+        raise ZeroDivisionError("Division par zéro")
+    return a / b
+
+def number_mod(a, b):
+    """Calcule le modulo de deux nombres bruts, lève une erreur si division par zéro."""
+    if b == 0:
+        raise ZeroDivisionError("Modulo par zéro")
+    return a % b
+
+def get_number_operation_dict():
+    """
+    Retourne, pour les opérateurs qui le permettent, une version spécialisée
+    de la primitive appliquée directement aux valeurs brutes de deux nombres.
+    Les opérations arithmétiques retournent un nombre brut (int ou float),
+    les comparaisons un VBool.
+    """
+    return {
+        '+': lambda a, b: a + b,
+        '-': lambda a, b: a - b,
+        '*': lambda a, b: a * b,
+        '/': number_div,
+        '%': number_mod,
+        '==': lambda a, b: box_bool(a == b),
+        '!=': lambda a, b: box_bool(a != b),
+        '<': lambda a, b: box_bool(a < b),
+        '<=': lambda a, b: box_bool(a <= b),
+        '>': lambda a, b: box_bool(a > b),
+        '>=': lambda a, b: box_bool(a >= b),
+    }
+
 def get_primitive_dict():
     """Retourne le dictionnaire des fonctions primitives."""
     return {
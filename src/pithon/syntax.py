@@ -1,126 +1,180 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
-@dataclass
-class PiNone:
+@dataclass(slots=True)
+class PiNode:
+    """Classe de base des nœuds de l'arbre syntaxique Pithon."""
+
+@dataclass(slots=True)
+class PiNone(PiNode):
     value: None
 
-@dataclass
-class PiNumber:
+@dataclass(slots=True)
+class PiNumber(PiNode):
     value: float
 
-@dataclass
-class PiBool:
+@dataclass(slots=True)
+class PiBool(PiNode):
     value: bool
 
-@dataclass
-class PiVariable:
+@dataclass(slots=True)
+class PiVariable(PiNode):
     name: str
-
-@dataclass
-class PiBinaryOperation:
+    # Emplacement de la variable locale (-1 : recherche par nom).
+    _slot: int = field(default=-1, init=False, repr=False, compare=False)
+    # Cache de la dernière recherche par nom : cadre où le nom a été trouvé et
+    # version de ce cadre pour lesquels `_cached_value` est valide.
+    _cached_frame: object = field(default=None, init=False, repr=False, compare=False)
+    _cached_version: int = field(default=-1, init=False, repr=False, compare=False)
+    _cached_value: object = field(default=None, init=False, repr=False, compare=False)
+
+@dataclass(slots=True)
+class PiBinaryOperation(PiNode):
     left: 'PiExpression'
     operator: str
     right: 'PiExpression'
+    # Primitive de l'opérateur et chemin rapide nombre/nombre, résolus à la compilation.
+    _op_fn: object = field(default=None, init=False, repr=False, compare=False)
+    _num_fn: object = field(default=None, init=False, repr=False, compare=False)
 
-@dataclass
-class PiAssignment:
+@dataclass(slots=True)
+class PiAssignment(PiNode):
     name: str
     value: 'PiExpression'
+    # Emplacement de la variable locale (-1 : recherche par nom).
+    _slot: int = field(default=-1, init=False, repr=False, compare=False)
 
-@dataclass
-class PiIfThenElse:
+@dataclass(slots=True)
+class PiIfThenElse(PiNode):
     condition: 'PiExpression'
     then_branch: list['PiStatement']
     else_branch: list['PiStatement']
 
-@dataclass
-class PiNot:
+@dataclass(slots=True)
+class PiNot(PiNode):
     operand: 'PiExpression'
 
-@dataclass
-class PiAnd:
+@dataclass(slots=True)
+class PiAnd(PiNode):
     left: 'PiExpression'
     right: 'PiExpression'
 
-@dataclass
-class PiOr:
+@dataclass(slots=True)
+class PiOr(PiNode):
     left: 'PiExpression'
     right: 'PiExpression'
 
-@dataclass
-class PiWhile:
+@dataclass(slots=True)
+class PiWhile(PiNode):
     condition: 'PiExpression'
     body: list['PiStatement']
+    # Gestionnaires des instructions du corps (voir resolve_handlers).
+    _body_handlers: tuple | None = field(default=None, init=False, repr=False, compare=False)
 
-@dataclass
-class PiList:
+@dataclass(slots=True)
+class PiList(PiNode):
     elements: list['PiExpression']
 
-@dataclass
-class PiTuple:
+@dataclass(slots=True)
+class PiTuple(PiNode):
     elements: tuple['PiExpression', ...]
 
-@dataclass
-class PiString:
+@dataclass(slots=True)
+class PiString(PiNode):
     value: str
 
-@dataclass
-class PiFunctionDef:
+@dataclass(slots=True)
+class PiConst(PiNode):
+    # Valeur (EnvValue) d'un sous-arbre constant, calculée à la compilation.
+    value: object
+
+@dataclass(slots=True)
+class PiFunctionDef(PiNode):
     name: str
     arg_names: list[str]
     vararg: str | None
     body: list['PiStatement']
-
-@dataclass
-class PiFunctionCall:
+    # Gestionnaires des instructions du corps (voir resolve_handlers).
+    _body_handlers: tuple | None = field(default=None, init=False, repr=False, compare=False)
+    _compiled: bool = field(default=False, init=False, repr=False, compare=False)
+    # Noms des paramètres, et sans le premier ('self' pour une méthode).
+    _arg_names: tuple[str, ...] = field(default=(), init=False, repr=False, compare=False)
+    _non_self_arg_names: tuple[str, ...] = field(default=(), init=False, repr=False, compare=False)
+    # Emplacements des variables locales de la fonction, par nom.
+    _slot_names: dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    # Vrai si le cadre d'appel ne peut pas être capturé (pas de def ni de
+    # class dans le corps) et peut donc être réutilisé après l'appel.
+    _poolable: bool = field(default=False, init=False, repr=False, compare=False)
+    # Emplacement de la variable locale (-1 : recherche par nom).
+    _slot: int = field(default=-1, init=False, repr=False, compare=False)
+
+@dataclass(slots=True)
+class PiFunctionCall(PiNode):
     function: 'PiExpression'
     args: list['PiExpression']
+    # Arguments figés en tuple à la compilation.
+    _args_tuple: tuple | None = field(default=None, init=False, repr=False, compare=False)
 
-@dataclass
-class PiFor:
+@dataclass(slots=True)
+class PiFor(PiNode):
     var: str
     iterable: 'PiExpression'
     body: list['PiStatement']
-
-@dataclass
-class PiBreak:
+    # Emplacement de la variable locale (-1 : recherche par nom).
+    _slot: int = field(default=-1, init=False, repr=False, compare=False)
+    # Vrai si l'itérable est un appel de la forme range(...).
+    _range_call: bool = field(default=False, init=False, repr=False, compare=False)
+    # Gestionnaires des instructions du corps (voir resolve_handlers).
+    _body_handlers: tuple | None = field(default=None, init=False, repr=False, compare=False)
+
+@dataclass(slots=True)
+class PiBreak(PiNode):
     pass
 
-@dataclass
-class PiContinue:
+@dataclass(slots=True)
+class PiContinue(PiNode):
     pass
 
-@dataclass
-class PiIn:
+@dataclass(slots=True)
+class PiIn(PiNode):
     element: 'PiExpression'
     container: 'PiExpression'
+    # Couples (type, valeur) des éléments d'un conteneur littéral, pour un
+    # test d'appartenance en temps constant (None sinon).
+    _prebuilt_set: frozenset | None = field(default=None, init=False, repr=False, compare=False)
 
-@dataclass
-class PiReturn:
+@dataclass(slots=True)
+class PiReturn(PiNode):
     value: 'PiExpression'
 
-@dataclass
-class PiSubscript:
+@dataclass(slots=True)
+class PiSubscript(PiNode):
     collection: 'PiExpression'
     index: 'PiExpression'
 
-@dataclass
-class PiClassDef:
+@dataclass(slots=True)
+class PiClassDef(PiNode):
     name: str
     methods: list['PiFunctionDef']
+    # Emplacement de la variable locale (-1 : recherche par nom).
+    _slot: int = field(default=-1, init=False, repr=False, compare=False)
 
-@dataclass
-class PiAttribute:
+@dataclass(slots=True)
+class PiAttribute(PiNode):
     object: 'PiExpression'
     attr: str
-
-@dataclass
-class PiAttributeAssignment:
+    # Cache en ligne : nature de l'attribut (0 = absent, 1 = attribut
+    # d'instance, 2 = méthode) et, pour une méthode, classe et méthode trouvées.
+    _ic_kind: int = field(default=0, init=False, repr=False, compare=False)
+    _ic_class: object = field(default=None, init=False, repr=False, compare=False)
+    _ic_method: object = field(default=None, init=False, repr=False, compare=False)
+
+@dataclass(slots=True)
+class PiAttributeAssignment(PiNode):
     object: 'PiExpression'
     attr: str
     value: 'PiExpression'
 
-PiValue = PiNumber | PiBool | PiNone | PiList | PiTuple | PiString
+PiValue = PiNumber | PiBool | PiNone | PiList | PiTuple | PiString | PiConst
 
 PiExpression = (
     PiValue
@@ -0,0 +1,22 @@
+class A:
+    def __init__(self):
+        self.x = 1
+a = A()
+print((True and a).x)
+print((False or a).x)
+print(0 or "vide")
+print((a or 1).x)
+print(not a)
+if a:
+    print("objet vrai")
+def g():
+    return 0
+if g:
+    print("fonction vraie")
+print(not g)
+if A:
+    print("classe vraie")
+print(not A)
+if print:
+    print("primitive vraie")
+print(not print)
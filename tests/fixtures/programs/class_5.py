@@ -0,0 +1,24 @@
+class Chat:
+    def __init__(self):
+        self.nom = "chat"
+
+    def cri(self):
+        return "miaou"
+
+class Chien:
+    def __init__(self):
+        self.nom = "chien"
+
+    def cri(self):
+        return "wouf"
+
+def parle(animal):
+    return animal.nom + " : " + animal.cri()
+
+for animal in [Chat(), Chien(), Chat(), Chien()]:
+    print(parle(animal))
+
+c = Chat()
+print(c.cri())
+c.cri = "attribut"
+print(c.cri)
@@ -0,0 +1,19 @@
+def compteur(depart):
+    n = depart
+    def suivant(pas):
+        return n + pas
+    return suivant
+a = compteur(10)
+b = compteur(20)
+def carre(x):
+    return x * x
+print(carre(3))
+print(a(1))
+print(b(2))
+print(carre(4) + a(5))
+def fact(n):
+    if n < 2:
+        return 1
+    return n * fact(n - 1)
+print(fact(10))
+print(a(0))
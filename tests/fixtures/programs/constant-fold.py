@@ -0,0 +1,24 @@
+print(2 + 3 * 4)
+print("ab" + "cd")
+print(not True)
+if 1 < 2:
+    print("vrai")
+else:
+    print("faux")
+if False:
+    print("jamais")
+x = [1, 2, 3]
+print(x)
+print((1, "a", [2.5, 3]))
+def f():
+    if True:
+        return 1 / 2
+    return 0
+print(f())
+for i in range(2):
+    print([i, 1 + 1])
+print(1 in [1, 2, 3, 4, 5])
+print((1 + 2, 3))
+print(((1, 2), (3, 4)))
+print(4 in (1, 2, 3, 2 + 2))
+print(5 in (1, 2, 3, 2 + 2))
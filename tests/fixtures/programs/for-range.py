@@ -0,0 +1,12 @@
+total = 0
+for i in range(2, 6):
+    total = total + i
+print(total)
+for i in range(10):
+    if i == 3:
+        break
+    print(i)
+def range(n):
+    return [n, n]
+for x in range(7):
+    print(x)
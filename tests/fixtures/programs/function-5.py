@@ -0,0 +1,32 @@
+x = 10
+
+def externe(a):
+    b = a * 2
+    def interne(c):
+        return a + b + c + x
+    return interne
+
+f = externe(1)
+g = externe(100)
+print(f(1))
+print(g(1))
+print(f(2))
+
+def compteur(n):
+    total = 0
+    for i in range(n):
+        total = total + i
+    return total
+
+print(compteur(5))
+print(compteur(10))
+
+def usine():
+    class Point:
+        def __init__(self, x, y):
+            self.x = x
+            self.y = y
+    return Point(3, 4)
+
+p = usine()
+print(p.x + p.y)
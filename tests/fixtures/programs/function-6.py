@@ -0,0 +1,35 @@
+def fabrique(a):
+    def lire(autre):
+        if autre == None:
+            return a
+        return autre(None) + a
+    return lire
+
+un = fabrique(1)
+cent = fabrique(100)
+print(un(cent))
+print(cent(un))
+
+n = 1
+def lire_n():
+    return n
+
+for i in range(3):
+    print(lire_n())
+    n = n + 1
+
+def ombre():
+    n = 100
+    def lire():
+        return n
+    return lire() + lire_n()
+print(ombre())
+print(lire_n())
+
+def texte(v):
+    return str(v) + "!"
+print(texte(1))
+def str(x):
+    return "autre"
+print(texte(1))
+print(str(2))
@@ -0,0 +1,20 @@
+def premier_pair(valeurs):
+    for v in valeurs:
+        if v % 2 == 0:
+            return v
+    return None
+def somme_impairs(n):
+    total = 0
+    for i in range(n):
+        if i % 2 == 0:
+            continue
+        if i > 7:
+            break
+        total = total + i
+    return total
+def derniere_valeur(x):
+    y = x + 1
+for k in range(3):
+    print(premier_pair([1, 3, k * 2 + 1, 4]))
+    print(somme_impairs(k * 5))
+print(derniere_valeur(1))
@@ -0,0 +1,10 @@
+for x in [0, 1, 2, 3, 4, 5, 6]:
+    if x in [1, 3, 5, 7, 9]:
+        print(x)
+print(True in [1, 2, 3, 4])
+print(1 in [True, False, None, "a"])
+print(2.0 in (1, 2, 3, 4))
+print("c" in ("a", "b", "c", "d"))
+print([1] in [1, 2, 3, 4])
+print(None in [1, 2, 3, 4])
+print(2 in [1, 2, 3])
@@ -0,0 +1,27 @@
+a = [1, 2, 3]
+b = [1.5, 2.5]
+c = [1, 2.5, "x"]
+print(a)
+print(b)
+print(c)
+print(a[0])
+print(b[1])
+print(2 in a)
+print(2.0 in a)
+print(True in a)
+print("x" in c)
+print(a == [1, 2, 3])
+print(a == [1.0, 2.0, 3.0])
+print(a == [1, 2])
+print(a + b)
+print(a * 2)
+print(range(3))
+print(range(3) == [0, 1, 2])
+for x in b:
+    print(x)
+print(str(a))
+print([[1, 2], [3]])
+print(10000000000000000000000 in [1, 2])
+print([10000000000000000000000, 1])
+print([True, 1] == [1, 1])
+print((a, b))
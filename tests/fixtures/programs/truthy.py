@@ -0,0 +1,20 @@
+if 0:
+    print("zéro")
+else:
+    print("zéro est faux")
+if "texte":
+    print("chaîne non vide")
+if []:
+    print("liste vide")
+else:
+    print("liste vide est fausse")
+if [1, 2]:
+    print("liste non vide")
+if not ():
+    print("tuple vide est faux")
+n = 3
+while n:
+    print(n)
+    n = n - 1
+print(None or 0 or "défaut")
+print(1 and [] and 2)
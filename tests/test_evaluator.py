@@ -0,0 +1,16 @@
+import pytest
+
+from pithon.evaluator.evaluator import BreakException, ContinueException, initial_env, run
+from pithon.parser.simpleparser import SimpleParser
+
+
+@pytest.mark.parametrize("source, exception", [
+    ("def f():\n    continue\ndef g():\n    y = f()\n    return y\ng()\n", ContinueException),
+    ("def f():\n    break\nf()\n", BreakException),
+    ("class A:\n    def m(self):\n        break\nA().m()\n", BreakException),
+    ("class A:\n    def __init__(self):\n        continue\nA()\n", ContinueException),
+])
+def test_break_continue_hors_boucle(source, exception):
+    """Un break ou continue hors de toute boucle dans une fonction lève une exception."""
+    with pytest.raises(exception):
+        run(SimpleParser().parse(source), initial_env())
@@ -0,0 +1,129 @@
+import pytest
+
+from pithon.evaluator import jit
+from pithon.evaluator.evaluator import initial_env, run
+from pithon.parser.simpleparser import SimpleParser
+
+
+def parse_function(source: str):
+    """Retourne la définition de la première fonction du source."""
+    return SimpleParser().parse(source)[0]
+
+
+def test_transpile_fonction_numerique():
+    """Une fonction qui ne manipule que des entiers locaux est traduite."""
+    funcdef = parse_function(
+        "def somme(n):\n"
+        "    total = 0\n"
+        "    for i in range(n):\n"
+        "        if i % 2 == 0:\n"
+        "            total = total + i\n"
+        "    return total\n"
+    )
+    source, returns_bool = jit.transpile(funcdef)
+    assert not returns_bool
+    namespace = {}
+    exec(source, namespace)
+    assert namespace["_pithon_jit"](10) == 20
+
+
+def test_transpile_condition_entiere():
+    """Un entier sert de condition : il est vrai s'il est non nul."""
+    source, _ = jit.transpile(parse_function(
+        "def f(x):\n    if x % 2:\n        return 1\n    return 0\n"
+    ))
+    namespace = {}
+    exec(source, namespace)
+    assert [namespace["_pithon_jit"](x) for x in range(4)] == [0, 1, 0, 1]
+
+
+def test_transpile_affectation_sur_tous_les_chemins():
+    """Une variable affectée sur tous les chemins qui atteignent sa lecture est acceptée."""
+    source, _ = jit.transpile(parse_function(
+        "def f(n):\n"
+        "    if n > 0:\n"
+        "        r = n\n"
+        "    else:\n"
+        "        return 0\n"
+        "    return r\n"
+    ))
+    namespace = {}
+    exec(source, namespace)
+    assert [namespace["_pithon_jit"](n) for n in (-1, 0, 3)] == [0, 0, 3]
+
+
+@pytest.mark.parametrize("source", [
+    "def f(x):\n    return x / 2\n",               # division flottante
+    "def f(x):\n    return [x]\n",                 # liste
+    "def f(x):\n    print(x)\n    return x\n",     # appel de fonction
+    "def f(x):\n    return x + y\n",               # variable non locale
+    "def f(x):\n    return (x < 1) + 1\n",         # arithmétique sur un booléen
+    "def f(x):\n    x = 1\n",                      # pas de return final
+    "def f(n):\n    if n > 0:\n        r = n\n    return r\n",          # r pas toujours affecté
+    "def f(n):\n    for i in range(n):\n        n = i\n    return i\n",  # boucle peut-être vide
+])
+def test_transpile_refuse_fonction_non_numerique(source):
+    """Les fonctions hors du sous-ensemble numérique restent interprétées."""
+    with pytest.raises(jit.NotCompilable):
+        jit.transpile(parse_function(source))
+
+
+def test_execution_compilee(monkeypatch, capfd):
+    """Avec Numba, les appels répétés passent par la version compilée."""
+    pytest.importorskip("numba")
+    monkeypatch.setattr(jit, "enabled", True)
+    monkeypatch.setattr(jit, "JIT_THRESHOLD", 2)
+    env = initial_env()
+    run(SimpleParser().parse(
+        "def carre(n):\n"
+        "    return n * n\n"
+        "for i in range(5):\n"
+        "    print(carre(i))\n"
+    ), env)
+    assert capfd.readouterr().out == "0\n1\n4\n9\n16\n"
+    closure = env.lookup("carre")
+    assert closure._numba_fn not in (None, False)
+
+
+def test_depassement_entier_reinterprete(monkeypatch, capfd):
+    """Un calcul qui dépasse 64 bits est refait par l'interpréteur."""
+    pytest.importorskip("numba")
+    monkeypatch.setattr(jit, "enabled", True)
+    monkeypatch.setattr(jit, "JIT_THRESHOLD", 2)
+    env = initial_env()
+    run(SimpleParser().parse(
+        "def fact(n):\n"
+        "    r = 1\n"
+        "    for i in range(1, n + 1):\n"
+        "        r = r * i\n"
+        "    return r\n"
+        "for n in [5, 6, 25, 7, 21]:\n"
+        "    print(fact(n))\n"
+    ), env)
+    assert capfd.readouterr().out == (
+        "120\n720\n15511210043330985984000000\n5040\n51090942171709440000\n"
+    )
+    closure = env.lookup("fact")
+    assert closure._numba_fn not in (None, False)
+
+
+def test_range_redefini_apres_compilation(monkeypatch, capfd):
+    """Une redéfinition de range après la compilation est prise en compte."""
+    pytest.importorskip("numba")
+    monkeypatch.setattr(jit, "enabled", True)
+    monkeypatch.setattr(jit, "JIT_THRESHOLD", 2)
+    env = initial_env()
+    run(SimpleParser().parse(
+        "def h(n):\n"
+        "    s = 0\n"
+        "    for i in range(n):\n"
+        "        s = s + i\n"
+        "    return s\n"
+        "for k in range(3):\n"
+        "    print(h(4))\n"
+        "def range(n):\n"
+        "    return [100, 200]\n"
+        "print(h(4))\n"
+    ), env)
+    assert capfd.readouterr().out == "6\n6\n6\n300\n"
+    assert env.lookup("h")._numba_fn not in (None, False)